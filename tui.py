@@ -12,6 +12,10 @@ import asyncio
 import threading
 import subprocess
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+import logging
+from logging.handlers import RotatingFileHandler
+from collections import OrderedDict
 from pathlib import Path
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical
@@ -31,9 +35,11 @@ from textual.reactive import reactive
 from textual.message import Message
 from textual import work
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 from pyPreservica import (
     EntityAPI,
     UploadAPI,
+    upload_config,
 )
 
 # Load .env file if present (system environment variables take precedence)
@@ -44,10 +50,58 @@ USERNAME = os.getenv("PRESERVICA_USERNAME")
 PASSWORD = os.getenv("PRESERVICA_PASSWORD")
 SERVER = os.getenv("PRESERVICA_SERVER")
 BUCKET = os.getenv("PRESERVICA_BUCKET")
-# S3 upload threshold in MB (default: 100MB)
-S3_THRESHOLD_MB = int(os.getenv("PRESERVICA_S3_THRESHOLD", "100"))
+# S3 upload threshold, set in MB (default: 100MB) and kept in bytes
+S3_THRESHOLD_BYTES = int(os.getenv("PRESERVICA_S3_THRESHOLD", "100")) * 1024 * 1024
+# Optional: S3 multipart part size in MB and number of parts sent in parallel
+S3_CHUNK_MB = int(os.getenv("PRESERVICA_S3_CHUNK_MB", "16"))
+S3_CONCURRENCY = int(os.getenv("PRESERVICA_S3_CONCURRENCY", "10"))
 # Optional: override temp/export folder for package creation
 TEMP_FOLDER = os.getenv("PRESERVICA_TEMP_FOLDER")
+# Optional: zip compression level for folder uploads, 0 (store only) to 9.
+# When unset, folders large enough for S3 are stored and others use level 1.
+_zip_compress = os.getenv("PRESERVICA_ZIP_COMPRESS")
+ZIP_COMPRESS_LEVEL = int(_zip_compress) if _zip_compress else None
+if ZIP_COMPRESS_LEVEL is not None and not 0 <= ZIP_COMPRESS_LEVEL <= 9:
+    raise ValueError(
+        f"PRESERVICA_ZIP_COMPRESS must be between 0 and 9, got {ZIP_COMPRESS_LEVEL}"
+    )
+# Maximum number of folder listings fetched from Preservica at once
+MAX_CONCURRENT_FETCHES = 16
+# Number of folder listings kept in memory for instant re-expansion
+DESC_CACHE_SIZE = 512
+# Minimum seconds between upload progress messages
+PROGRESS_INTERVAL = 0.1
+# Upload failures are appended here, with a few rotated copies kept
+ERROR_LOG = "upload_error.log"
+
+logger = logging.getLogger("preservica_upload")
+
+
+def _configure_logging() -> None:
+    """Send upload errors to a rotating log file in the working directory."""
+    handler = RotatingFileHandler(
+        ERROR_LOG, maxBytes=1024 * 1024, backupCount=3, encoding="utf-8", delay=True
+    )
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    logger.addHandler(handler)
+
+
+def _configure_transfers() -> None:
+    """Tune the boto3 TransferConfig that pyPreservica uses for package uploads."""
+    config = upload_config()
+    config.multipart_chunksize = S3_CHUNK_MB * 1024 * 1024
+    config.max_concurrency = S3_CONCURRENCY
+    config.use_threads = True
+
+
+def _loop_factory():
+    """Return uvloop's event loop factory when uvloop is installed, else None."""
+    try:
+        import uvloop
+    except ImportError:
+        # Optional speed-up, and not available on Windows
+        return None
+    return uvloop.new_event_loop
 
 
 def _supports_unicode() -> bool:
@@ -67,8 +121,16 @@ ICON_UP = "⬆️" if _UNICODE else "^"
 ICON_UPLOAD = "📤" if _UNICODE else ">>"
 
 
-class UploadProgressMessage(Message):
-    """Message sent when upload progress updates."""
+def _format_eta(remaining: float) -> str:
+    """Format seconds remaining as an ETA such as "12s" or "1.5m"."""
+    return f"{remaining:.0f}s" if remaining < 60 else f"{remaining/60:.1f}m"
+
+
+class ProgressMessage(Message):
+    """Base for messages carrying a percentage and an optional ETA.
+
+    The ETA comes from _format_eta, handlers add the "~" when displaying it.
+    """
 
     def __init__(self, percentage: int, eta_str: str = "") -> None:
         self.percentage = percentage
@@ -76,39 +138,88 @@ class UploadProgressMessage(Message):
         super().__init__()
 
 
+class UploadProgressMessage(ProgressMessage):
+    """Message sent when upload progress updates."""
+
+
+class ZipProgressMessage(ProgressMessage):
+    """Message sent when folder zipping progress updates."""
+
+
+def _collect_files(folder: Path) -> tuple[list[tuple[Path, int]], int]:
+    """Return every file below a folder with its size, and the total size."""
+    all_files = []
+    total_bytes = 0
+    # os.scandir hands back the type with each entry, so unlike os.walk plus
+    # Path.stat only the files themselves need a stat call
+    stack = [folder]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    file_size = entry.stat().st_size
+                    all_files.append((Path(entry.path), file_size))
+                    total_bytes += file_size
+    return all_files, total_bytes
+
+
+def _zip_compression(total_bytes: int) -> tuple[int, int | None]:
+    """Pick the zip compression method and level for a folder of this size."""
+    level = ZIP_COMPRESS_LEVEL
+    if level is None:
+        # Large folders are mostly media that doesn't compress, skip the CPU cost
+        level = 0 if total_bytes >= S3_THRESHOLD_BYTES else 1
+    if level == 0:
+        return zipfile.ZIP_STORED, None
+    return zipfile.ZIP_DEFLATED, level
+
+
 class UploadProgressCallback:
     """Callback class to update Textual progress bar during upload."""
 
-    def __init__(self, filename: str, app):
+    def __init__(self, filename: str, app, size: int | None = None):
         self._filename = filename
-        self._size = float(os.path.getsize(filename))
+        size = size if size is not None else os.path.getsize(filename)
+        # Integer and at least 1, so the percentage is a single floor division
+        self._size = max(int(size), 1)
+        # Bytes sent per transfer thread, see __call__
+        self._seen_by_thread: dict[int, int] = {}
         self._seen_so_far = 0
-        self._lock = threading.Lock()
         self.app = app
         self._last_percentage = -1
+        self._last_post = 0.0
         self._start_time = time.monotonic()
 
     def __call__(self, bytes_amount):
-        with self._lock:
-            self._seen_so_far += bytes_amount
-            percentage = int((self._seen_so_far / self._size) * 100)
-
-            # Throttle: only update every 5% to avoid overwhelming the event loop
-            if percentage >= self._last_percentage + 5 or (
-                percentage == 100 and self._last_percentage != 100
-            ):
-                self._last_percentage = percentage
-                eta_str = ""
-                elapsed = time.monotonic() - self._start_time
-                if elapsed > 1 and self._seen_so_far > 0 and percentage < 100:
-                    rate = self._seen_so_far / elapsed
-                    remaining = (self._size - self._seen_so_far) / rate
-                    eta_str = (
-                        f"~{remaining:.0f}s"
-                        if remaining < 60
-                        else f"~{remaining/60:.1f}m"
-                    )
-                self.app.post_message(UploadProgressMessage(percentage, eta_str))
+        # boto3 calls this from several transfer threads. Each thread only
+        # ever updates its own slot, so no update is lost and no lock is needed
+        thread_id = threading.get_ident()
+        seen = self._seen_by_thread
+        seen[thread_id] = seen.get(thread_id, 0) + bytes_amount
+
+        # Throttle: most chunks return here having done no more than the add
+        # above, keeping the time each transfer thread holds the GIL short.
+        # The upload's completion is reported by _upload_package itself.
+        now = time.monotonic()
+        if now - self._last_post < PROGRESS_INTERVAL:
+            return
+        self._last_post = now
+
+        self._seen_so_far = sum(seen.copy().values())
+        percentage = self._seen_so_far * 100 // self._size
+        if percentage == self._last_percentage:
+            return
+
+        self._last_percentage = percentage
+        eta_str = ""
+        elapsed = now - self._start_time
+        if elapsed > 1 and self._seen_so_far > 0 and percentage < 100:
+            rate = self._seen_so_far / elapsed
+            remaining = (self._size - self._seen_so_far) / rate
+            eta_str = _format_eta(remaining)
+        self.app.post_message(UploadProgressMessage(percentage, eta_str))
 
 
 class PreservicaTree(Tree):
@@ -117,64 +228,145 @@ class PreservicaTree(Tree):
     def __init__(self, *args, **kwargs):
         super().__init__("Preservica Folders", *args, **kwargs)
         self.entity_client = None
+        self._client_lock = asyncio.Lock()
         self.folder_map = {}  # Maps tree node IDs to folder UUIDs
+        # Own thread pool, so folder fetches don't compete with the upload and
+        # zip threads in asyncio's default executor
+        self._fetch_executor = ThreadPoolExecutor(
+            max_workers=MAX_CONCURRENT_FETCHES, thread_name_prefix="preservica-fetch"
+        )
+        self._loading: set[int] = set()  # Node IDs with a fetch in flight
+        # Maps folder UUIDs to (title, reference, entity type) tuples, cleared on refresh
+        self.desc_cache: OrderedDict[str | None, list[tuple[str, str, str]]] = (
+            OrderedDict()
+        )
         # Add initial loading message
         self.root.add_leaf(f"{ICON_WAIT} Loading folders...")
 
-    async def on_mount(self) -> None:
-        """Initialize the Preservica connection and load root folders."""
-        try:
-            self.entity_client = EntityAPI(
-                username=USERNAME, password=PASSWORD, server=SERVER
-            )
-            # Clear loading message
-            self.root.remove_children()
-            await self.load_root_folders()
-        except Exception as e:
-            # Clear loading message and show error
-            self.root.remove_children()
-            self.root.add_leaf(f"{ICON_ERROR} Error: {e}")
+    def on_mount(self) -> None:
+        """Load root folders, connecting to Preservica on first use."""
+        # In a worker, so the login doesn't hold up mounting the rest of the app
+        self.run_worker(self.load_root_folders(), group="folders")
+
+    async def _ensure_entity_client(self) -> EntityAPI:
+        """Create the entity client on first use and reuse it afterwards."""
+        async with self._client_lock:
+            if self.entity_client is None:
+                # Logging in is a blocking HTTP round-trip, keep it off the event loop
+                self.entity_client = await asyncio.to_thread(
+                    EntityAPI, username=USERNAME, password=PASSWORD, server=SERVER
+                )
+                self._size_connection_pool()
+        return self.entity_client
+
+    def on_unmount(self) -> None:
+        """Close the pooled HTTP connections and the fetch threads."""
+        self._fetch_executor.shutdown(wait=False, cancel_futures=True)
+        if self.entity_client is not None:
+            self.entity_client.session.close()
+
+    def _size_connection_pool(self) -> None:
+        """Keep one reusable connection per concurrent fetch instead of requests' 10."""
+        prefix = f"{self.entity_client.protocol}://"
+        session = self.entity_client.session
+        # Keep pyPreservica's retry policy on the replacement adapter
+        retries = session.get_adapter(prefix).max_retries
+        session.mount(
+            prefix,
+            HTTPAdapter(pool_maxsize=MAX_CONCURRENT_FETCHES, max_retries=retries),
+        )
+
+    async def _fetch_descendants(self, folder_uuid: str | None) -> list:
+        """Fetch the children of a folder in a worker thread."""
+        # pyPreservica's session already retries failed requests with backoff
+        return await asyncio.get_running_loop().run_in_executor(
+            self._fetch_executor,
+            lambda: list(self.entity_client.descendants(folder_uuid)),
+        )
+
+    async def _folder_contents(
+        self, folder_uuid: str | None
+    ) -> list[tuple[str, str, str]]:
+        """Return a folder's children, served from the cache when already fetched."""
+        if folder_uuid in self.desc_cache:
+            self.desc_cache.move_to_end(folder_uuid)
+            return self.desc_cache[folder_uuid]
+
+        entities = [
+            (entity.title, entity.reference, entity.entity_type.name)
+            for entity in await self._fetch_descendants(folder_uuid)
+        ]
+        self.desc_cache[folder_uuid] = entities
+        if len(self.desc_cache) > DESC_CACHE_SIZE:
+            self.desc_cache.popitem(last=False)
+        return entities
 
     async def load_root_folders(self) -> None:
         """Load root folders from Preservica."""
         try:
+            await self._ensure_entity_client()
             # Get root folders (descendants with None parent)
-            for entity in self.entity_client.descendants(None):
-                if entity.entity_type.name == "FOLDER":
-                    node = self.root.add(entity.title, expand=False)
-                    self.folder_map[node.id] = entity.reference
-                    # Add a placeholder to show it's expandable
-                    node.add_leaf("Loading...")
-                elif entity.entity_type.name == "ASSET":
-                    # Add assets as non-selectable leaves
-                    self.root.add_leaf(f"{ICON_FILE} {entity.title}")
+            entities = await self._folder_contents(None)
         except Exception as e:
-            self.root.add_leaf(f"Error loading folders: {e}")
+            # Clear loading message and show error
+            self.root.remove_children()
+            self.root.add_leaf(f"{ICON_ERROR} Error loading folders: {e}")
+            return
 
-    async def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
+        # Clear loading message
+        self.root.remove_children()
+        for title, reference, entity_type in entities:
+            if entity_type == "FOLDER":
+                node = self.root.add(title, expand=False)
+                self.folder_map[node.id] = reference
+                # Add a placeholder to show it's expandable
+                node.add_leaf("Loading...")
+            elif entity_type == "ASSET":
+                # Add assets as non-selectable leaves
+                self.root.add_leaf(f"{ICON_FILE} {title}")
+
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
         """Load child folders when a node is expanded."""
         node = event.node
 
         # Check if this is a folder node that needs loading
-        if node.id in self.folder_map and node.children:
-            # Remove placeholder
-            for child in list(node.children):
-                child.remove()
-
-            # Load actual children
-            folder_uuid = self.folder_map[node.id]
-            try:
-                for entity in self.entity_client.descendants(folder_uuid):
-                    if entity.entity_type.name == "FOLDER":
-                        child_node = node.add(entity.title, expand=False)
-                        self.folder_map[child_node.id] = entity.reference
-                        # Add placeholder for expandable folders
-                        child_node.add_leaf("Loading...")
-                    elif entity.entity_type.name == "ASSET":
-                        # Add assets as non-selectable leaves
-                        node.add_leaf(f"{ICON_FILE} {entity.title}")
-            except Exception as e:
-                node.add_leaf(f"Error: {e}")
+        if (
+            node.id in self.folder_map
+            and node.children
+            and node.id not in self._loading
+        ):
+            # Show a single placeholder until the children arrive
+            node.remove_children()
+            node.add_leaf("Loading...")
+
+            # Load in a worker so expanding several folders fetches them concurrently
+            self._loading.add(node.id)
+            self._load_children(node)
+
+    @work(group="folders")
+    async def _load_children(self, node) -> None:
+        """Fetch a folder's children from Preservica and add them to the tree."""
+        folder_uuid = self.folder_map[node.id]
+        try:
+            entities = await self._folder_contents(folder_uuid)
+        except Exception as e:
+            node.remove_children()
+            node.add_leaf(f"Error: {e}")
+            return
+        finally:
+            self._loading.discard(node.id)
+
+        # Replace the placeholder with the actual children
+        node.remove_children()
+        for title, reference, entity_type in entities:
+            if entity_type == "FOLDER":
+                child_node = node.add(title, expand=False)
+                self.folder_map[child_node.id] = reference
+                # Add placeholder for expandable folders
+                child_node.add_leaf("Loading...")
+            elif entity_type == "ASSET":
+                # Add assets as non-selectable leaves
+                node.add_leaf(f"{ICON_FILE} {title}")
 
 
 class StatusBar(Static):
@@ -270,7 +462,9 @@ class PreservicaUploadApp(App):
         super().__init__(*args, **kwargs)
         self.selected_local_path: Path | None = None
         self.selected_preservica_folder: str | None = None
+        self.selected_preservica_title: str | None = None
         self.upload_client = None
+        self._upload_in_progress = False
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
@@ -289,12 +483,17 @@ class PreservicaUploadApp(App):
                 yield Label("Preservica Folders", classes="panel-title")
                 yield PreservicaTree(id="preservica-tree")
 
+        # Status bar and progress bar are updated on every progress message,
+        # so keep the instances rather than querying for them each time
+        self._status_bar = StatusBar(id="status-bar")
+        self._progress_bar = ProgressBar(id="progress-bar", show_eta=False)
+
         # Status bar
-        yield StatusBar(id="status-bar")
+        yield self._status_bar
 
         # Progress bar container
         with Container(id="progress-container"):
-            yield ProgressBar(id="progress-bar", show_eta=False)
+            yield self._progress_bar
 
         # Buttons
         with Horizontal(id="button-container"):
@@ -303,20 +502,18 @@ class PreservicaUploadApp(App):
 
         yield Footer()
 
-    async def on_mount(self) -> None:
-        try:
-            self.upload_client = UploadAPI(
-                username=USERNAME, password=PASSWORD, server=SERVER
-            )
-            # Hide progress bar initially
-            progress_bar = self.query_one("#progress-bar", ProgressBar)
-            progress_bar.display = False
+    def on_mount(self) -> None:
+        # Hide progress bar initially
+        self._progress_bar.display = False
 
-            self.update_status(
-                "Ready. Select a local file and Preservica folder, then click Upload."
-            )
-        except Exception as e:
-            self.update_status(f"Error initializing upload client: {e}")
+        self.update_status(
+            "Ready. Select a local file and Preservica folder, then click Upload."
+        )
+
+    def on_unmount(self) -> None:
+        """Close the upload client's HTTP session."""
+        if self.upload_client is not None:
+            self.upload_client.session.close()
 
     def on_directory_tree_file_selected(
         self, event: DirectoryTree.FileSelected
@@ -340,305 +537,263 @@ class PreservicaUploadApp(App):
         # Only allow selection of nodes that are in folder_map (actual folders, not assets)
         if node.id in tree.folder_map:
             self.selected_preservica_folder = tree.folder_map[node.id]
+            self.selected_preservica_title = str(node.label)
             self.update_status(f"Selected Preservica folder: {node.label}")
         else:
             # Clear selection if an asset leaf is highlighted
             self.selected_preservica_folder = None
             self.update_status("Please select a Preservica folder (not an asset)")
 
-    async def on_button_pressed(self, event: Button.Pressed) -> None:
+    def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
         if event.button.id == "upload-btn":
             self.action_upload()
         elif event.button.id == "refresh-btn":
-            await self.action_refresh()
+            self.action_refresh()
 
     def on_upload_progress_message(self, message: UploadProgressMessage) -> None:
         """Handle upload progress messages."""
-        progress_bar = self.query_one("#progress-bar", ProgressBar)
-        progress_bar.update(progress=message.percentage)
+        self._progress_bar.update(progress=message.percentage)
         if message.eta_str:
             self.update_status(
-                f"{ICON_UP} Uploading: {message.percentage}% - {message.eta_str} remaining"
+                f"{ICON_UP} Uploading: {message.percentage}% - ~{message.eta_str} remaining"
             )
 
-    @work(thread=True, exclusive=True)
-    def action_upload(self) -> None:
+    def on_zip_progress_message(self, message: ZipProgressMessage) -> None:
+        """Handle folder zipping progress messages."""
+        self._progress_bar.update(progress=message.percentage)
+        if message.eta_str:
+            self.update_status(
+                f"{ICON_PKG} Zipping: {message.percentage}% - ~{message.eta_str} remaining"
+            )
+        else:
+            self.update_status(f"{ICON_PKG} Zipping: {message.percentage}%")
+
+    async def _ensure_upload_client(self) -> UploadAPI:
+        """Create the upload client on first use and reuse it afterwards."""
+        if self.upload_client is None:
+            self.update_status(f"{ICON_WAIT} Connecting to Preservica...")
+            # Logging in is a blocking HTTP round-trip, keep it off the event loop
+            self.upload_client = await asyncio.to_thread(
+                UploadAPI, username=USERNAME, password=PASSWORD, server=SERVER
+            )
+        return self.upload_client
+
+    def show_progress(self) -> None:
+        """Show the progress bar, reset to 0%."""
+        self._progress_bar.display = True
+        self._progress_bar.update(total=100, progress=0)
+
+    def hide_progress(self) -> None:
+        """Hide the progress bar."""
+        self._progress_bar.display = False
+
+    @work(group="upload")
+    async def action_upload(self) -> None:
         """Upload the selected file to the selected Preservica folder."""
+        if self._upload_in_progress:
+            self.update_status(f"{ICON_WAIT} An upload is already in progress")
+            return
+
         if not self.selected_local_path:
-            self.call_from_thread(
-                self.update_status,
-                f"{ICON_ERROR} Please select a local file or folder first",
+            self.update_status(
+                f"{ICON_ERROR} Please select a local file or folder first"
             )
             return
 
         if not self.selected_preservica_folder:
-            self.call_from_thread(
-                self.update_status,
-                f"{ICON_ERROR} Please select a Preservica folder first",
-            )
+            self.update_status(f"{ICON_ERROR} Please select a Preservica folder first")
             return
 
-        try:
-            # Show file size
-            file_size_mb = self.selected_local_path.stat().st_size / (1024 * 1024)
-            self.call_from_thread(
-                self.update_status, f"{ICON_FOLDER} File size: {file_size_mb:.2f} MB"
-            )
+        # Take a snapshot, the selection can change while we await
+        local_path = self.selected_local_path
+        folder = self.selected_preservica_folder
+        # Status messages are batched per phase, one status bar render each
+        msgs = [f"{ICON_UPLOAD} Uploading to folder: {self.selected_preservica_title}"]
 
-            # Show folder being uploaded to
-            self.call_from_thread(
-                self.update_status,
-                f"{ICON_UPLOAD} Uploading to folder: {self.selected_preservica_folder.title}",
-            )
+        self._upload_in_progress = True
+        try:
+            await self._ensure_upload_client()
 
-            if self.selected_local_path.is_file():
+            if local_path.is_file():
                 # Upload single file
                 from pyPreservica import simple_asset_package
 
-                # Create asset package
-                self.call_from_thread(
-                    self.update_status, f"{ICON_PKG} Creating asset package..."
-                )
+                # Show file size, then create asset package
+                file_size_mb = local_path.stat().st_size / (1024 * 1024)
+                msgs.append(f"{ICON_FOLDER} File size: {file_size_mb:.2f} MB")
+                msgs.append(f"{ICON_PKG} Creating asset package...")
+                self.update_status(" | ".join(msgs))
                 package_kwargs = dict(
-                    preservation_file=str(self.selected_local_path),
-                    parent_folder=self.selected_preservica_folder,
+                    preservation_file=str(local_path),
+                    parent_folder=folder,
                 )
                 if TEMP_FOLDER:
                     package_kwargs["export_folder"] = TEMP_FOLDER
-                zip_package = simple_asset_package(**package_kwargs)
-
-                # Show package info
-                package_size_mb = os.path.getsize(zip_package) / (1024 * 1024)
-                self.call_from_thread(
-                    self.update_status,
-                    f"{ICON_PKG} Package created: {os.path.basename(zip_package)}",
-                )
-                self.call_from_thread(
-                    self.update_status,
-                    f"{ICON_PKG} Package size: {package_size_mb:.2f} MB",
+                zip_package = await asyncio.to_thread(
+                    simple_asset_package, **package_kwargs
                 )
 
-                # Determine upload method based on package size
-                use_s3 = package_size_mb >= S3_THRESHOLD_MB
-                if use_s3:
-                    self.call_from_thread(
-                        self.update_status,
-                        f"{ICON_PKG} Large file detected - using S3 upload...",
-                    )
-
-                # Upload the package
-                self.call_from_thread(
-                    self.update_status, f"{ICON_UP} Starting upload..."
-                )
-
-                # Show progress bar
-                def show_progress():
-                    progress_bar = self.query_one("#progress-bar", ProgressBar)
-                    progress_bar.display = True
-                    progress_bar.update(total=100, progress=0)
-
-                self.call_from_thread(show_progress)
-
-                # Create callback for upload progress
-                callback = UploadProgressCallback(zip_package, self)
-
-                # Choose upload method based on size
-                if use_s3:
-                    result = self.upload_client.upload_zip_package_to_S3(
-                        path_to_zip_package=zip_package,
-                        bucket_name=BUCKET,
-                        folder=self.selected_preservica_folder,
-                        callback=callback,
-                        delete_after_upload=True,
-                    )
-                else:
-                    result = self.upload_client.upload_zip_package(
-                        path_to_zip_package=zip_package,
-                        folder=self.selected_preservica_folder,
-                        callback=callback,
-                        delete_after_upload=True,
-                    )
+                try:
+                    await self._upload_package(zip_package, folder)
+                finally:
+                    # Uploads delete the package on success, don't leave it
+                    # behind in the temp folder when they fail
+                    Path(zip_package).unlink(missing_ok=True)
 
-                # Upload complete
-                def hide_progress():
-                    progress_bar = self.query_one("#progress-bar", ProgressBar)
-                    progress_bar.display = False
+            elif local_path.is_dir():
+                self.update_status(" | ".join(msgs))
 
-                self.call_from_thread(hide_progress)
-                self.call_from_thread(
-                    self.update_status,
-                    f"{ICON_OK} Upload complete! Check Preservica web UI for ingest progress.",
-                )
-
-            elif self.selected_local_path.is_dir():
                 # Collect all files first for accurate progress
-                all_files = []
-                total_bytes = 0
-                for root, dirs, files in os.walk(self.selected_local_path):
-                    for file in files:
-                        file_path = Path(root) / file
-                        file_size = file_path.stat().st_size
-                        all_files.append((file_path, file_size))
-                        total_bytes += file_size
+                all_files, total_bytes = await asyncio.to_thread(
+                    _collect_files, local_path
+                )
 
                 total_mb = total_bytes / (1024 * 1024)
-                self.call_from_thread(
-                    self.update_status,
-                    f"{ICON_PKG} Zipping {len(all_files)} files ({total_mb:.1f} MB)...",
+                self.update_status(
+                    f"{ICON_PKG} Zipping {len(all_files)} files ({total_mb:.1f} MB)..."
                 )
 
                 # Show progress bar for zip phase
-                def show_zip_progress():
-                    progress_bar = self.query_one("#progress-bar", ProgressBar)
-                    progress_bar.display = True
-                    progress_bar.update(total=100, progress=0)
-
-                self.call_from_thread(show_zip_progress)
+                self.show_progress()
 
                 # Create a temporary zip file of the folder
                 temp_dir = TEMP_FOLDER if TEMP_FOLDER else tempfile.gettempdir()
-                zip_file_path = Path(temp_dir) / f"{self.selected_local_path.name}.zip"
-
-                zip_start = time.monotonic()
-                bytes_done = 0
-                last_pct = -1
-
-                with zipfile.ZipFile(zip_file_path, "w", zipfile.ZIP_DEFLATED) as zf:
-                    for file_path, file_size in all_files:
-                        arcname = file_path.relative_to(self.selected_local_path.parent)
-                        zf.write(file_path, arcname)
-                        bytes_done += file_size
-                        pct = (
-                            int(bytes_done / total_bytes * 100)
-                            if total_bytes > 0
-                            else 100
-                        )
-                        if pct != last_pct:
-                            last_pct = pct
-                            elapsed = time.monotonic() - zip_start
-                            if elapsed > 1 and bytes_done > 0:
-                                rate = bytes_done / elapsed
-                                remaining = (total_bytes - bytes_done) / rate
-                                eta = (
-                                    f"{remaining:.0f}s"
-                                    if remaining < 60
-                                    else f"{remaining/60:.1f}m"
-                                )
-                                status = (
-                                    f"{ICON_PKG} Zipping: {pct}% - ~{eta} remaining"
-                                )
-                            else:
-                                status = f"{ICON_PKG} Zipping: {pct}%"
-
-                            def update_zip_ui(p=pct, s=status):
-                                self.query_one("#progress-bar", ProgressBar).update(
-                                    progress=p
-                                )
-                                self.update_status(s)
-
-                            self.call_from_thread(update_zip_ui)
-
-                zip_file = str(zip_file_path)
-
-                # Show package info
-                package_size_mb = os.path.getsize(zip_file) / (1024 * 1024)
-                self.call_from_thread(
-                    self.update_status,
-                    f"{ICON_PKG} Package created: {os.path.basename(zip_file)}",
-                )
-                self.call_from_thread(
-                    self.update_status,
-                    f"{ICON_PKG} Package size: {package_size_mb:.2f} MB",
-                )
-
-                # Determine upload method based on package size
-                use_s3 = package_size_mb >= S3_THRESHOLD_MB
-                if use_s3:
-                    self.call_from_thread(
-                        self.update_status,
-                        f"{ICON_PKG} Large file detected - using S3 upload...",
+                zip_file_path = Path(temp_dir) / f"{local_path.name}.zip"
+
+                try:
+                    await asyncio.to_thread(
+                        self._zip_folder,
+                        local_path,
+                        all_files,
+                        total_bytes,
+                        zip_file_path,
                     )
-
-                # Upload the zip directly
-                self.call_from_thread(
-                    self.update_status, f"{ICON_UP} Starting upload..."
-                )
-
-                # Show progress bar
-                def show_progress():
-                    progress_bar = self.query_one("#progress-bar", ProgressBar)
-                    progress_bar.display = True
-                    progress_bar.update(total=100, progress=0)
-
-                self.call_from_thread(show_progress)
-
-                # Create callback for upload progress
-                callback = UploadProgressCallback(zip_file, self)
-
-                # Choose upload method based on size
-                if use_s3:
-                    result = self.upload_client.upload_zip_package_to_S3(
-                        path_to_zip_package=zip_file,
-                        bucket_name=BUCKET,
-                        folder=self.selected_preservica_folder,
-                        callback=callback,
-                        delete_after_upload=True,
-                    )
-                else:
-                    result = self.upload_client.upload_zip_package(
-                        path_to_zip_package=zip_file,
-                        folder=self.selected_preservica_folder,
-                        callback=callback,
-                        delete_after_upload=True,
-                    )
-
-                # Upload complete
-                def hide_progress():
-                    progress_bar = self.query_one("#progress-bar", ProgressBar)
-                    progress_bar.display = False
-
-                self.call_from_thread(hide_progress)
-                self.call_from_thread(
-                    self.update_status,
-                    f"{ICON_OK} Upload complete! Check Preservica web UI for ingest progress.",
-                )
+                    await self._upload_package(str(zip_file_path), folder)
+                finally:
+                    zip_file_path.unlink(missing_ok=True)
 
             else:
-                self.call_from_thread(
-                    self.update_status,
-                    f"{ICON_ERROR} Selected path is neither a file nor a folder",
+                self.update_status(
+                    f"{ICON_ERROR} Selected path is neither a file nor a folder"
                 )
 
         except Exception as e:
-            import traceback
-
-            error_detail = traceback.format_exc()
-            self.call_from_thread(
-                self.update_status, f"{ICON_ERROR} Upload failed: {e}"
+            self.update_status(f"{ICON_ERROR} Upload failed: {e}")
+            self.hide_progress()
+            # Log full error to see what's happening, file I/O stays off the loop
+            await asyncio.to_thread(
+                logger.error, "Upload of %s failed", local_path, exc_info=e
+            )
+        finally:
+            self._upload_in_progress = False
+
+    def _zip_folder(
+        self,
+        local_path: Path,
+        all_files: list[tuple[Path, int]],
+        total_bytes: int,
+        zip_file_path: Path,
+    ) -> None:
+        """Zip a local folder, posting progress. Runs in a worker thread."""
+        zip_start = time.monotonic()
+        bytes_done = 0
+        last_pct = -1
+        compression, level = _zip_compression(total_bytes)
+
+        with zipfile.ZipFile(
+            zip_file_path, "w", compression, compresslevel=level
+        ) as zf:
+            for file_path, file_size in all_files:
+                arcname = file_path.relative_to(local_path.parent)
+                zf.write(file_path, arcname)
+                bytes_done += file_size
+                pct = int(bytes_done / total_bytes * 100) if total_bytes > 0 else 100
+                if pct != last_pct:
+                    last_pct = pct
+                    eta = ""
+                    elapsed = time.monotonic() - zip_start
+                    if elapsed > 1 and bytes_done > 0:
+                        rate = bytes_done / elapsed
+                        remaining = (total_bytes - bytes_done) / rate
+                        eta = _format_eta(remaining)
+                    self.post_message(ZipProgressMessage(pct, eta))
+
+    async def _upload_package(self, zip_package: str, folder: str) -> None:
+        """Upload a zip package, choosing the S3 route for large packages."""
+        # pyPreservica resizes parts on its shared config for packages over
+        # 1GB and never resets them, so start every upload from our values
+        _configure_transfers()
+
+        # Show package info
+        package_size = os.path.getsize(zip_package)
+        package_size_mb = package_size / (1024 * 1024)  # for display only
+        msgs = [
+            f"{ICON_PKG} Package created: {os.path.basename(zip_package)}",
+            f"{ICON_PKG} Package size: {package_size_mb:.2f} MB",
+        ]
+
+        # Determine upload method based on package size
+        use_s3 = package_size >= S3_THRESHOLD_BYTES
+        if use_s3:
+            msgs.append(f"{ICON_PKG} Large file detected - using S3 upload...")
+
+        # Upload the package
+        msgs.append(f"{ICON_UP} Starting upload...")
+        self.update_status(" | ".join(msgs))
+        self.show_progress()
+
+        # Create callback for upload progress. It is called from boto3's
+        # transfer threads and reports back through post_message.
+        callback = UploadProgressCallback(zip_package, self, size=package_size)
+
+        # Choose upload method based on size
+        if use_s3:
+            await asyncio.to_thread(
+                self.upload_client.upload_zip_package_to_S3,
+                path_to_zip_package=zip_package,
+                bucket_name=BUCKET,
+                folder=folder,
+                callback=callback,
+                delete_after_upload=True,
+            )
+        else:
+            await asyncio.to_thread(
+                self.upload_client.upload_zip_package,
+                path_to_zip_package=zip_package,
+                folder=folder,
+                callback=callback,
+                delete_after_upload=True,
             )
 
-            def hide_progress_on_error():
-                progress_bar = self.query_one("#progress-bar", ProgressBar)
-                progress_bar.display = False
-
-            self.call_from_thread(hide_progress_on_error)
-            # Log full error to see what's happening
-            with open("upload_error.log", "w") as f:
-                f.write(error_detail)
+        # Upload complete
+        self.hide_progress()
+        self.update_status(
+            f"{ICON_OK} Upload complete! Check Preservica web UI for ingest progress."
+        )
 
-    async def action_refresh(self) -> None:
+    def action_refresh(self) -> None:
         """Refresh the Preservica folder tree."""
         tree = self.query_one("#preservica-tree", PreservicaTree)
+        # Drop any in-flight folder loads, their nodes are about to disappear
+        self.workers.cancel_group(tree, "folders")
         tree.clear()
         tree.folder_map.clear()
+        tree.desc_cache.clear()
+        tree.root.add_leaf(f"{ICON_WAIT} Loading folders...")
+        self.update_status(f"{ICON_WAIT} Refreshing Preservica folders...")
+        # Reload in the tree's "folders" worker group, so the fetch doesn't
+        # block the app's message queue and a later refresh can cancel it
+        tree.run_worker(self._reload_tree(tree), group="folders")
+
+    async def _reload_tree(self, tree: PreservicaTree) -> None:
+        """Load the root folders again and report when done."""
         await tree.load_root_folders()
         self.update_status("Refreshed Preservica folders")
 
     def update_status(self, message: str) -> None:
         """Update the status bar message."""
-        status_bar = self.query_one("#status-bar", StatusBar)
-        status_bar.update_message(message)
+        self._status_bar.update_message(message)
 
 
 def main():
@@ -708,8 +863,10 @@ def main():
         return
 
     # Normal operation - launch the TUI
+    _configure_logging()
     app = PreservicaUploadApp()
-    app.run()
+    # Same as app.run(), but lets uvloop drive the app when it is installed
+    asyncio.run(app.run_async(), loop_factory=_loop_factory())
 
 
 if __name__ == "__main__":